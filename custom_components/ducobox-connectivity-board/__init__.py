@@ -17,13 +17,13 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Ducobox from a config entry."""
     base_url = entry.data["base_url"]
-    _LOGGER.debug(f"Base URL from config entry: {base_url}")
+    _LOGGER.debug("Base URL from config entry: %s", base_url)
 
     try:
         duco_client = DucoPy(base_url=base_url, verify=False)
         coordinator = DucoboxCoordinator(hass, duco_client)
         await coordinator.async_config_entry_first_refresh()
-        _LOGGER.debug(f"DucoPy initialized with base URL: {base_url}")
+        _LOGGER.debug("DucoPy initialized with base URL: %s", base_url)
         hass.data.setdefault(DOMAIN, {})
         hass.data[DOMAIN][entry.entry_id] = {'client': duco_client, 'coordinator': coordinator}
     except Exception as ex:
@@ -47,7 +47,7 @@ class DucoboxConnectivityBoardConfigFlow(config_entries.ConfigFlow, domain=DOMAI
 
     async def async_step_zeroconf(self, discovery_info: ZeroconfServiceInfo) -> FlowResult:
         """Handle discovery via mDNS."""
-        _LOGGER.debug(f"Discovery info: {discovery_info}")
+        _LOGGER.debug("Discovery info: %s", discovery_info)
 
         valid_names = ['duco_', 'duco ']
 
@@ -59,7 +59,7 @@ class DucoboxConnectivityBoardConfigFlow(config_entries.ConfigFlow, domain=DOMAI
         host = discovery_info.addresses[0]
         unique_id = discovery_info.name.split(" ")[1].strip("[]")
 
-        _LOGGER.debug(f"Extracted host: {host}, unique_id: {unique_id}")
+        _LOGGER.debug("Extracted host: %s, unique_id: %s", host, unique_id)
 
         # Check if the device has already been configured
         await self.async_set_unique_id(unique_id)
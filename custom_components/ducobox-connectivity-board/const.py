@@ -2,3 +2,8 @@ from datetime import timedelta
 
 DOMAIN = "ducobox_connectivity_board"
 SCAN_INTERVAL = timedelta(seconds=60)
+# Consecutive updates with the sensor's data path absent after which it is marked unavailable
+MISSING_VALUE_POLLS = 10
+# How often, in updates, an unavailable sensor's data path is checked again; a sensor
+# whose path comes back recovers on the next such check
+MISSING_VALUE_REPROBE_POLLS = 10
@@ -3,10 +3,10 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
-from homeassistant.core import HomeAssistant
-from ..const import SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, callback
+from ..const import DOMAIN, MISSING_VALUE_POLLS, MISSING_VALUE_REPROBE_POLLS, SCAN_INTERVAL
 from .devices import DucoboxSensorEntityDescription, DucoboxNodeSensorEntityDescription
-from .utils import safe_get
+from .utils import MISSING, extract, model_to_dict, safe_get
 from typing import Any
 from ducopy import DucoPy
 from ducopy.rest.models import ConfigNodeRequest
@@ -15,6 +15,9 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 import time
 import json
+import sys
+import asyncio
+from functools import partial
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,11 +35,37 @@ class DucoboxCoordinator(DataUpdateCoordinator):
 
         self.duco_client = duco_client
         self._static_data = None
+        # node device id -> DeviceInfo, shared by the sensor, number and select platforms
+        self._node_device_info = {}
+        # Same index as data['nodes_by_id'], kept as an attribute for the per-sensor reads
+        self.nodes_by_id = {}
+        # Sensors computed once per refresh, as (node id or None, key, value_fn). A sensor's
+        # position in this list is its index into values and _missing_streaks.
+        self._sensor_registrations = []
+        # Value of each registered sensor from the last refresh
+        self.values = []
+        # Refreshes in a row in which each registered sensor's data path was absent.
+        # Sensors at MISSING_VALUE_POLLS are parked: only read again every
+        # MISSING_VALUE_REPROBE_POLLS refreshes.
+        self._missing_streaks = []
 
     async def _async_update_data(self) -> dict:
         """Fetch data from the Ducobox API."""
+        duco_client = self.duco_client
+
+        if duco_client is None:
+            raise UpdateFailed("Duco client is not initialized")
+
         try:
-            return await self.hass.async_add_executor_job(self._fetch_data)
+            # The endpoints are independent, so keep their round-trips in flight together
+            info, nodes_response, config_nodes = await asyncio.gather(
+                self.hass.async_add_executor_job(duco_client.get_info),
+                self.hass.async_add_executor_job(duco_client.get_nodes),
+                self.hass.async_add_executor_job(duco_client.raw_get, '/config/nodes'),
+            )
+            data = self._build_data(info, nodes_response, config_nodes)
+            self._update_values(data)
+            return data
         except Exception as e:
             _LOGGER.error("Failed to fetch data from Ducobox API: %s", e)
             raise UpdateFailed(f"Failed to fetch data from Ducobox API: {e}") from e
@@ -49,48 +78,112 @@ class DucoboxCoordinator(DataUpdateCoordinator):
         data = {}
         node_actions = self.duco_client.raw_get('/action/nodes')
         data['action_nodes'] = node_actions
-        _LOGGER.debug(f"Data received from /action/nodes = {node_actions}")
+        _LOGGER.debug("Data received from /action/nodes = %s", node_actions)
 
         return data
 
-    def _fetch_data(self) -> dict:
-        duco_client = self.duco_client
-
+    def _build_data(self, info, nodes_response, config_nodes) -> dict:
         data = {}
 
-        if duco_client is None:
-            raise Exception("Duco client is not initialized")
-
-        try:
-            data['info'] = duco_client.get_info()
-            _LOGGER.debug(f"Data received from /info: {data}")
-
-            nodes_response = duco_client.get_nodes()
-            _LOGGER.debug(f"Data received from /info/nodes: {nodes_response}")
-
-            if nodes_response and hasattr(nodes_response, 'Nodes'):
-                data['nodes'] = [node.dict() for node in nodes_response.Nodes]
-            else:
-                data['nodes'] = []
-
-            config_nodes = duco_client.raw_get('/config/nodes')
-            data['config_nodes'] = config_nodes
-            _LOGGER.debug(f"Data received from /config/nodes = {data['config_nodes']}")
-
-            data['mappings'] = {'node_id_to_name': {}, 'node_id_to_type': {}}
-            for node in data['nodes']:
-                node_id = node.get('Node')
-                node_type = safe_get(node, 'General', 'Type', 'Val') or 'Unknown'
-                node_name = f"{node_id}:{node_type}"
-
-                data['mappings']['node_id_to_name'][node_id] = node_name
-                data['mappings']['node_id_to_type'][node_id] = node_type
-
-
-            return {**data, **self._static_data}
-        except Exception as e:
-            _LOGGER.error("Error fetching data from Ducobox API: %s", e)
-            raise e
+        data['info'] = info
+        _LOGGER.debug("Data received from /info: %s", data)
+
+        _LOGGER.debug("Data received from /info/nodes: %s", nodes_response)
+
+        nodes = getattr(nodes_response, 'Nodes', None)
+        data['nodes_by_id'] = self.nodes_by_id = self._index_nodes(nodes) if nodes else {}
+
+        data['config_nodes'] = config_nodes
+        _LOGGER.debug("Data received from /config/nodes = %s", data['config_nodes'])
+
+        data['mappings'] = {'node_id_to_name': {}, 'node_id_to_type': {}}
+        for node_id, node in data['nodes_by_id'].items():
+            node_type = safe_get(node, 'General', 'Type', 'Val') or 'Unknown'
+            node_name = f"{node_id}:{node_type}"
+
+            data['mappings']['node_id_to_name'][node_id] = node_name
+            data['mappings']['node_id_to_type'][node_id] = node_type
+
+        return {**data, **self._static_data}
+
+    def register_sensor(self, node_id, key, value_fn) -> int:
+        """Register a sensor whose value is computed on every refresh.
+
+        node_id is None for sensors reading the box info instead of a node.
+        Returns the sensor's index into values.
+        """
+        index = len(self._sensor_registrations)
+        self._sensor_registrations.append((node_id, key, value_fn))
+        self.values.append(None)
+        self._missing_streaks.append(0)
+        if self.data is not None:
+            self._refresh_value(index, self.data, self.nodes_by_id)
+        return index
+
+    def value_missing(self, index) -> bool:
+        """Return if the sensor at index is parked because its data path is absent."""
+        return self._missing_streaks[index] >= MISSING_VALUE_POLLS
+
+    def _update_values(self, data) -> None:
+        """Compute the values of all registered sensors from freshly fetched data."""
+        nodes_by_id = self.nodes_by_id
+        for index in range(len(self._sensor_registrations)):
+            self._refresh_value(index, data, nodes_by_id)
+
+    def _refresh_value(self, index, data, nodes_by_id) -> None:
+        """Compute the value of the sensor at index and update its missing streak."""
+        streak = self._missing_streaks[index]
+        if streak >= MISSING_VALUE_POLLS and (streak - MISSING_VALUE_POLLS) % MISSING_VALUE_REPROBE_POLLS:
+            # Parked, and not yet due to check whether the path is back
+            self._missing_streaks[index] = streak + 1
+            self.values[index] = None
+            return
+
+        node_id, key, value_fn = self._sensor_registrations[index]
+        source = data if node_id is None else nodes_by_id.get(node_id)
+        value = MISSING
+        if source is not None:
+            # A failing extractor is caught per sensor so one bad value cannot
+            # fail the whole update
+            try:
+                value = value_fn(source)
+            except Exception as e:
+                _LOGGER.debug("Error getting value for %s on node %s: %s", key, node_id, e)
+                value = None
+
+        # Only an absent path counts towards parking; None is a normal value
+        if value is MISSING:
+            self._missing_streaks[index] = streak + 1
+            value = None
+        else:
+            self._missing_streaks[index] = 0
+        self.values[index] = value
+
+    def _index_nodes(self, nodes) -> dict:
+        """Convert node models to dicts keyed by node id."""
+        nodes_by_id = {}
+        for node in nodes:
+            # Node ids are normalized to int so every lookup hashes and compares as int
+            node_id = int(node.Node)
+            node_dict = model_to_dict(node)
+            node_dict['Node'] = node_id
+            nodes_by_id[node_id] = node_dict
+
+        return nodes_by_id
+
+    def get_node_device_info(self, node_device_id, node_name, node_type, via_device) -> DeviceInfo:
+        """Return the DeviceInfo for a node, creating it on first use."""
+        device_info = self._node_device_info.get(node_device_id)
+        if device_info is None:
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, node_device_id)},
+                name=node_name,
+                manufacturer="Ducobox",
+                model=node_type,
+                via_device=via_device,
+            )
+            self._node_device_info[node_device_id] = device_info
+        return device_info
 
     async def async_set_value(self, node_id, key, value):
         """Send an update to the device."""
@@ -99,16 +192,15 @@ class DucoboxCoordinator(DataUpdateCoordinator):
                 key: {'Val': int(round(value, 0))},
             }, separators=(',', ':'))
 
-            logging.error(str(data))
-            logging.error(f'/config/nodes/{node_id}')
+            _LOGGER.debug("Sending %s to /config/nodes/%s", data, node_id)
             # Use the DucoPy client to update the configuration
             await self.hass.async_add_executor_job(
                 self.duco_client.raw_patch, f'/config/nodes/{node_id}', data
             )
 
-            _LOGGER.info(f"Successfully set value for node {node_id}, key {key} to {value}")
+            _LOGGER.info("Successfully set value for node %s, key %s to %s", node_id, key, value)
         except Exception as e:
-            _LOGGER.error(f"Failed to set value for node {node_id}, key {key}: {e}")
+            _LOGGER.error("Failed to set value for node %s, key %s: %s", node_id, key, e)
             raise
 
     async def async_set_ventilation_state(self, node_id, option, action):
@@ -117,45 +209,86 @@ class DucoboxCoordinator(DataUpdateCoordinator):
                 self.duco_client.change_action_node, action, option, node_id
             )
             
-            _LOGGER.info(f"Successfully set config value for node {node_id}, action {action} to {option}")
+            _LOGGER.info("Successfully set config value for node %s, action %s to %s", node_id, action, option)
         except Exception as e:
-            _LOGGER.error(f"Failed to set config value for node {node_id}, action {action}: {e}")
+            _LOGGER.error("Failed to set config value for node %s, action %s: %s", node_id, action, e)
             raise
 
-class DucoboxSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntity):
-    """Representation of a Ducobox sensor entity."""
-    entity_description: DucoboxSensorEntityDescription
+class DucoboxBaseSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntity):
+    """Base for Ducobox sensors, whose values the coordinator computes on each refresh.
+
+    A sensor whose data path stays absent for MISSING_VALUE_POLLS refreshes in a row
+    (e.g. no bypass module installed) is marked unavailable. The coordinator checks
+    the path again every MISSING_VALUE_REPROBE_POLLS refreshes, so the sensor
+    recovers at most that many refreshes after the path is back. A path that exists
+    but holds None (e.g. an idle timer) keeps the sensor available.
+    """
+
+    # The Home Assistant base classes keep their __dict__; slots still make the
+    # attributes read on every state update plain descriptor lookups
+    __slots__ = ('_value_index',)
 
     def __init__(
         self,
         coordinator: DucoboxCoordinator,
-        description: DucoboxSensorEntityDescription,
-        device_info: DeviceInfo,
-        unique_id: str,
+        node_id: int | None,
+        description: DucoboxSensorEntityDescription | DucoboxNodeSensorEntityDescription,
     ) -> None:
-        """Initialize a Ducobox sensor entity."""
+        """Register the sensor's value with the coordinator."""
         super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_device_info = device_info
-        self._attr_unique_id = unique_id
-        self._attr_name = f"{device_info['name']} {description.name}"
+        self._value_index = coordinator.register_sensor(
+            node_id,
+            description.key,
+            partial(extract, path=description.path, process_fn=description.process_fn),
+        )
+
+    def _update_availability(self) -> None:
+        self._attr_available = not self.coordinator.value_missing(self._value_index)
+
+    async def async_added_to_hass(self) -> None:
+        """Set the initial availability when added to hass."""
+        await super().async_added_to_hass()
+        self._update_availability()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the availability before writing the state."""
+        self._update_availability()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        # CoordinatorEntity.available only reflects last_update_success
+        return super().available and self._attr_available
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        try:
-            return self.entity_description.value_fn(self.coordinator.data)
-        except Exception as e:
-            _LOGGER.debug(f"Error getting value for {self.name}: {e}")
-            return None
+        return self.coordinator.values[self._value_index]
+
+class DucoboxSensorEntity(DucoboxBaseSensorEntity):
+    """Representation of a Ducobox sensor entity."""
+    __slots__ = ()
+    entity_description: DucoboxSensorEntityDescription
 
-class DucoboxNodeSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntity):
+    def __init__(
+        self,
+        coordinator: DucoboxCoordinator,
+        description: DucoboxSensorEntityDescription,
+        device_info: DeviceInfo,
+        unique_id: str,
+    ) -> None:
+        """Initialize a Ducobox sensor entity."""
+        super().__init__(coordinator, None, description)
+        self.entity_description = description
+        self._attr_device_info = device_info
+        self._attr_unique_id = unique_id
+        self._attr_name = sys.intern(f"{device_info['name']} {description.name}")
+
+class DucoboxNodeSensorEntity(DucoboxBaseSensorEntity):
     """Representation of a Ducobox node sensor entity."""
+    __slots__ = ()
     entity_description: DucoboxNodeSensorEntityDescription
 
     def __init__(
@@ -169,27 +302,8 @@ class DucoboxNodeSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntit
         node_name: str,
     ) -> None:
         """Initialize a Ducobox node sensor entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, node_id, description)
         self.entity_description = description
         self._attr_device_info = device_info
         self._attr_unique_id = unique_id
-        self._node_id = node_id
-        self._attr_name = f"{node_name} {description.name}"
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
-
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        nodes = self.coordinator.data.get('nodes', [])
-        for node in nodes:
-            if node.get('Node') == self._node_id:
-                try:
-                    return self.entity_description.value_fn(node)
-                except Exception as e:
-                    _LOGGER.debug(f"Error getting value for {self.name}: {e}")
-                    return None
-        return None
+        self._attr_name = sys.intern(f"{node_name} {description.name}")
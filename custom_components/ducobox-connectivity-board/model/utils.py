@@ -1,50 +1,55 @@
-def safe_get(data, *keys):
-    """Safely get nested keys from a dict."""
-    for key in keys:
-        if isinstance(data, dict):
-            data = data.get(key)
-        else:
-            return None
-    return data
+from functools import lru_cache
 
-# Node-specific processing functions
-def process_node_temperature(value):
-    """Process node temperature values."""
-    if value is not None:
-        return value  # Assuming value is in Celsius
-    return None
+def walk(data, path):
+    """Follow a precomputed tuple of keys into nested dicts, None if missing."""
+    try:
+        for key in path:
+            data = data[key]
+        return data
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None
 
-def process_node_humidity(value):
-    """Process node humidity values."""
-    if value is not None:
-        return value  # Assuming value is in percentage
-    return None
+# Returned by extract() when the path itself is absent, as opposed to a path
+# that exists but holds None (e.g. an idle node's TimeStateRemain)
+MISSING = object()
 
-def process_node_co2(value):
-    """Process node CO₂ values."""
-    if value is not None:
-        return value  # Assuming value is in ppm
-    return None
+def extract(data, path, process_fn=None):
+    """Walk path into data and run process_fn on the value if one was found.
 
-def process_node_iaq(value):
-    """Process node IAQ values."""
-    if value is not None:
-        return value  # Assuming value is in percentage
-    return None
+    Returns MISSING if any key along the path is absent.
+    """
+    try:
+        for key in path:
+            data = data[key]
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return MISSING
+    if data is None or process_fn is None:
+        return data
+    return process_fn(data)
+
+def safe_get(data, *keys):
+    """Safely get nested keys from a dict."""
+    return walk(data, keys)
 
-# Main sensor processing functions
+def model_to_dict(model):
+    """Convert a DucoPy pydantic model to a plain dict."""
+    # pydantic v2 serializes natively in model_dump(); its .dict() is a deprecated
+    # wrapper that raises a DeprecationWarning on every call.
+    model_dump = getattr(model, 'model_dump', None)
+    if model_dump is not None:
+        return model_dump()
+    return model.dict()
+
+# Main sensor processing functions, only needed where the raw value is converted.
+# Readings settle on a handful of raw values, so conversions are memoized.
+@lru_cache(maxsize=128)
 def process_temperature(value):
     """Process temperature values by dividing by 10."""
     if value is not None:
         return value / 10.0  # Convert from tenths of degrees Celsius
     return None
 
-def process_speed(value):
-    """Process speed values."""
-    if value is not None:
-        return value  # Assuming value is already in RPM
-    return None
-
+@lru_cache(maxsize=128)
 def process_pressure(value):
     """Process pressure values."""
     if value is not None:
@@ -52,27 +57,10 @@ def process_pressure(value):
         return float(value) * .1  # Assuming value is in Pa
     return None
 
-def process_rssi(value):
-    """Process Wi-Fi signal strength."""
-    if value is not None:
-        return value  # Assuming value is in dBm
-    return None
-
-def process_uptime(value):
-    """Process device uptime."""
-    if value is not None:
-        return value  # Assuming value is in seconds
-    return None
-
-def process_timefilterremain(value):
-    """Process filter time remaining."""
-    if value is not None:
-        return value  # Assuming value is in days
-    return None
-
+@lru_cache(maxsize=128)
 def process_bypass_position(value):
     """Process bypass position."""
     if value is not None:
         # Assuming value ranges from 0 to 100, where 100 is 100%
-        return int(round(float(value), 0))
+        return round(value)  # int in, int out; floats round to the nearest int
     return None
@@ -52,27 +52,25 @@ async def async_setup_entry(
 
     entities: list[NumberEntity] = []
 
+    via_device = (DOMAIN, device_id)
+
     # Add node numbers if data is available
     number_nodes = safe_get(coordinator.data, 'config_nodes', 'Nodes')
     for node in number_nodes:
-        node_id = node['Node']
+        node_id = int(node['Node'])
         node_type = safe_get(coordinator.data, 'mappings', 'node_id_to_type', node_id) or 'Unknown'
         mapped_node_name = safe_get(coordinator.data, 'mappings', 'node_id_to_name', node_id)
         node_name = f'{device_id}:{mapped_node_name}'
 
         # Create device info for the node
         node_device_id = f"{device_id}-{node_id}"
-        node_device_info = DeviceInfo(
-            identifiers={(DOMAIN, node_device_id)},
-            name=node_name,
-            manufacturer="Ducobox",
-            model=node_type,
-            via_device=(DOMAIN, device_id),
+        node_device_info = coordinator.get_node_device_info(
+            node_device_id, node_name, node_type, via_device
         )
 
         for key, value in node.items():
             if isinstance(value, dict) and 'Val' in value and 'Min' in value and 'Max' in value and 'Inc' in value:
-                unique_id = f"{node_device_id}-{key}"
+                unique_id = "-".join((node_device_id, key))
                 entities.append(
                     DucoboxNumberEntity(
                         coordinator=coordinator,
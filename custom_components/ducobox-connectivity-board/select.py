@@ -42,9 +42,11 @@ async def async_setup_entry(
 
     entities: list[SelectEntity] = []
 
+    via_device = (DOMAIN, device_id)
+
     action_nodes = safe_get(coordinator.data, 'action_nodes', 'Nodes')
     for node in action_nodes:
-        node_id = node['Node']
+        node_id = int(node['Node'])
         node_type = safe_get(coordinator.data, 'mappings', 'node_id_to_type', node_id) or 'Unknown'
         mapped_node_name = safe_get(coordinator.data, 'mappings', 'node_id_to_name', node_id)
         node_name = f'{device_id}:{mapped_node_name}'
@@ -52,12 +54,8 @@ async def async_setup_entry(
 
         # Create device info for the node
         node_device_id = f"{device_id}-{node_id}"
-        node_device_info = DeviceInfo(
-            identifiers={(DOMAIN, node_device_id)},
-            name=node_name,
-            manufacturer="Ducobox",
-            model=node_type,
-            via_device=(DOMAIN, device_id),
+        node_device_info = coordinator.get_node_device_info(
+            node_device_id, node_name, node_type, via_device
         )
 
         # Check for SetVentilationState action
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import defaultdict
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -49,7 +51,7 @@ async def async_setup_entry(
 
     # Add main Ducobox sensors
     for description in SENSORS:
-        unique_id = f"{device_id}-{description.key}"
+        unique_id = "-".join((device_id, description.key))
         entities.append(
             DucoboxSensorEntity(
                 coordinator=coordinator,
@@ -59,38 +61,41 @@ async def async_setup_entry(
             )
         )
 
-    # Add node sensors if data is available
-    nodes = safe_get(coordinator.data, 'nodes')
-    for node in nodes:
-        node_id = node.get('Node')
-        node_type = safe_get(node, 'General', 'Type', 'Val') or 'Unknown'
-        node_addr = safe_get(node, 'General', 'Addr') or 'Unknown'
-        node_name = f"{device_id}:{node_id}:{node_type}"
-
-        # Create device info for the node
-        node_device_id = f"{device_id}-{node_id}"
-        node_device_info = DeviceInfo(
-            identifiers={(DOMAIN, node_device_id)},
-            name=node_name,
-            manufacturer="Ducobox",
-            model=node_type,
-            via_device=(DOMAIN, device_id),
-        )
+    via_device = (DOMAIN, device_id)
 
+    # Add node sensors if data is available, grouped by node type so each
+    # type's sensor descriptions are looked up once
+    nodes_by_type = defaultdict(list)
+    for node_id, node_type in safe_get(coordinator.data, 'mappings', 'node_id_to_type').items():
+        nodes_by_type[node_type].append(node_id)
+
+    for node_type, node_ids in nodes_by_type.items():
         # Get the sensors for this node type
-        node_sensors = NODE_SENSORS.get(node_type, [])
-        for description in node_sensors:
-            unique_id = f"{node_device_id}-{description.key}"
-            entities.append(
-                DucoboxNodeSensorEntity(
-                    coordinator=coordinator,
-                    node_id=node_id,
-                    description=description,
-                    device_info=node_device_info,
-                    unique_id=unique_id,
-                    device_id=device_id,
-                    node_name=node_name,
-                )
+        node_sensors = NODE_SENSORS.get(node_type)
+        if not node_sensors:
+            continue
+
+        for node_id in node_ids:
+            node_name = f"{device_id}:{node_id}:{node_type}"
+
+            # Create device info for the node
+            node_device_id = f"{device_id}-{node_id}"
+            node_device_info = coordinator.get_node_device_info(
+                node_device_id, node_name, node_type, via_device
             )
 
+            for description in node_sensors:
+                unique_id = "-".join((node_device_id, description.key))
+                entities.append(
+                    DucoboxNodeSensorEntity(
+                        coordinator=coordinator,
+                        node_id=node_id,
+                        description=description,
+                        device_info=node_device_info,
+                        unique_id=unique_id,
+                        device_id=device_id,
+                        node_name=node_name,
+                    )
+                )
+
     async_add_entities(entities)